@@ -2,6 +2,7 @@
 Base agent manager module that defines the interface for all agent managers.
 """
 import time
+from http import HTTPStatus
 from typing import Dict, List, Optional, Any, Union
 import logging
 from concurrent.futures import ThreadPoolExecutor
@@ -31,7 +32,11 @@ class BaseAgentManager:
     
     def validate_agent_config(self, config: Dict[str, Any]) -> Union[bool, str]:
         """Validate the given agent configuration."""
-        raise NotImplemented("subclass must implement validate_agent_config")
+        raise NotImplementedError("Subclasses must implement validate_agent_config")
+
+    def prepare_task_dict(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply framework-specific defaults to a create request before validation."""
+        return config
 
     def get_schema(self) -> Any:
         """
@@ -111,22 +116,28 @@ class BaseAgentManager:
                     "error": agent.error
                 }
             
-            logger.info(f"Loaded {len(db_agents)} {self.framework_name} agents from database")
+            logger.info("Loaded %s %s agents from database", len(db_agents), self.framework_name)
             
         except Exception as e:
-            logger.error(f"Error loading {self.framework_name} agents from database: {str(e)}")
+            logger.error("Error loading %s agents from database", self.framework_name, exc_info=True)
         finally:
             db.close()
     
-    def create_agent(self, config: Dict[str, Any]) -> int:
-        """Create a new agent with the given configuration and store in database."""
+    def create_agent(self, config: Dict[str, Any], db: Optional[Session] = None) -> int:
+        """
+        Create a new agent with the given configuration and store in database.
+
+        When a session is passed the new rows are only flushed, so they commit or
+        roll back with the caller's transaction, and registering the agent is
+        left to the caller via register_agent once it has committed.
+        """
+        owns_session = db is None
+        if owns_session:
+            db = SessionLocal()
         try:
             # Set the framework name
             config["framework"] = self.framework_name
             
-            # Create database record
-            db = SessionLocal()
-            
             # Create base agent model
             db_agent = AgentModel(
                 name=config["name"],
@@ -143,27 +154,31 @@ class BaseAgentManager:
             # This is where we delegate to subclasses
             self._create_framework_config(db, db_agent, config)
 
-            db.commit()
-            db.refresh(db_agent)
-            
             agent_id = db_agent.id
+            if owns_session:
+                db.commit()
+                self.register_agent(agent_id, config)
+            else:
+                db.flush()
             
-            # Store in memory cache
-            self.agents[agent_id] = {
-                "config": config,
-                "status": "stopped",
-                "instance": None,
-                "results": []
-            }
-            
-            logger.info(f"Created agent {agent_id}: {config.get('name')}")
             return agent_id
             
         except Exception as e:
-            logger.error(f"Error creating agent: {str(e)}")
+            logger.error("Error creating agent", exc_info=True)
             raise
         finally:
-            db.close()
+            if owns_session:
+                db.close()
+    
+    def register_agent(self, agent_id: int, config: Dict[str, Any]) -> None:
+        """Add a newly created, stopped agent to the memory cache."""
+        self.agents[agent_id] = {
+            "config": config,
+            "status": "stopped",
+            "instance": None,
+            "results": []
+        }
+        logger.info("Created agent %s: %s", agent_id, config.get('name'))
     
     def start_agent(self, agent_id: int) -> bool:
         """
@@ -176,7 +191,7 @@ class BaseAgentManager:
         Stop a running agent and update database.
         """
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found")
+            logger.warning("Agent %s not found", agent_id)
             return False
             
         try:
@@ -197,14 +212,14 @@ class BaseAgentManager:
                 if db_agent:
                     db_agent.status = "stopped"
                     db.commit()
-                    logger.info(f"Agent {agent_id} stopped successfully")
+                    logger.info("Agent %s stopped successfully", agent_id)
             finally:
                 db.close()
                 
             return True
         
         except Exception as e:
-            logger.error(f"Error stopping agent {agent_id}: {str(e)}")
+            logger.error("Error stopping agent %s", agent_id, exc_info=True)
             return False
     
     def _cleanup_agent_resources(self, agent_id: int):
@@ -216,12 +231,15 @@ class BaseAgentManager:
     def query_agent(self, agent_id: int, query: str, max_retries: int = 2) -> Dict[str, Any]:
         """Run a query against an agent with retry logic."""
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found for query")
-            return {"error": "Agent not found"}
+            logger.warning("Agent %s not found for query", agent_id)
+            return {"error": "Agent not found", "status_code": HTTPStatus.NOT_FOUND}
             
         if self.agents[agent_id]["status"] != "running":
-            logger.warning(f"Agent {agent_id} not running for query")
-            return {"error": "Agent not running. Please start the agent first."}
+            logger.warning("Agent %s not running for query", agent_id)
+            return {
+                "error": "Agent not running. Please start the agent first.",
+                "status_code": HTTPStatus.BAD_REQUEST
+            }
         
         # Store query in database
         db = SessionLocal()
@@ -229,7 +247,7 @@ class BaseAgentManager:
             # Record the query attempt in the DB (if we had a query history table)
             pass
         except Exception as e:
-            logger.error(f"Error recording query: {str(e)}")
+            logger.error("Error recording query", exc_info=True)
         finally:
             db.close()
         
@@ -256,7 +274,7 @@ class BaseAgentManager:
                 
             except Exception as e:
                 last_error = str(e)
-                logger.error(f"Error querying agent {agent_id} (attempt {retries+1}): {last_error}")
+                logger.error("Error querying agent %s (attempt %s): %s", agent_id, retries+1, last_error)
                 retries += 1
                 
                 # If we have more retries, wait a bit before trying again
@@ -269,8 +287,11 @@ class BaseAgentManager:
                     del running_tasks[agent_id]
         
         # If we got here, all retries failed
-        logger.error(f"All retries failed for query to agent {agent_id}")
-        return {"error": f"Error executing query after {max_retries+1} attempts: {last_error}"}
+        logger.error("All retries failed for query to agent %s", agent_id)
+        return {
+            "error": f"Error executing query after {max_retries+1} attempts: {last_error}",
+            "status_code": HTTPStatus.INTERNAL_SERVER_ERROR
+        }
     
     def _run_query(self, agent_id: int, query: str) -> str:
         """Execute the query. To be implemented by subclasses."""
@@ -291,7 +312,7 @@ class BaseAgentManager:
     def delete_agent(self, agent_id: int) -> bool:
         """Delete an agent from the database and memory."""
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found for deletion")
+            logger.warning("Agent %s not found for deletion", agent_id)
             return False
 
         try:
@@ -303,7 +324,7 @@ class BaseAgentManager:
             db = SessionLocal()
             db_agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
             if not db_agent:
-                logger.warning(f"Agent {agent_id} not found in database")
+                logger.warning("Agent %s not found in database", agent_id)
                 return False
                 
             # Delete the agent from database
@@ -315,30 +336,39 @@ class BaseAgentManager:
             if agent_id in self.agents:
                 del self.agents[agent_id]
             
-            logger.info(f"Agent {agent_id} deleted successfully")
+            logger.info("Agent %s deleted successfully", agent_id)
             return True
             
         except Exception as e:
-            logger.error(f"Error deleting agent {agent_id}: {str(e)}")
+            logger.error("Error deleting agent %s", agent_id, exc_info=True)
             return False
         finally:
             db.close()
 
-    def update_agent(self, agent_id: int, config: Dict[str, Any]) -> bool:
-        """Update an existing agent with the given configuration and store in database."""
+    def update_agent(self, agent_id: int, config: Dict[str, Any], db: Optional[Session] = None) -> bool:
+        """
+        Update an existing agent with the given configuration and store in database.
+
+        When a session is passed the changes are only flushed, so they commit or
+        roll back with the caller's transaction, and refreshing the memory cache
+        and restarting a running agent are left to the caller via
+        refresh_agent_config and restart_if_running once it has committed.
+        """
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found for update")
+            logger.warning("Agent %s not found for update", agent_id)
             return False
 
+        owns_session = db is None
+        if owns_session:
+            db = SessionLocal()
         try:
             # Set the framework name (don't allow changing framework)
             config["framework"] = self.framework_name
             
             # Update database record
-            db = SessionLocal()
             db_agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
             if not db_agent:
-                logger.warning(f"Agent {agent_id} not found in database")
+                logger.warning("Agent %s not found in database", agent_id)
                 return False
                 
             # Update base fields
@@ -351,38 +381,47 @@ class BaseAgentManager:
             # Let subclasses handle this part
             self._update_framework_config(db, db_agent, config)
             
-            db.commit()
-            
-            # Update memory cache with framework-specific config
-            cache_config = {
-                "name": db_agent.name,
-                "description": db_agent.description,
-                "framework": db_agent.framework,
-                "model": db_agent.model,
-                "model_config": db_agent.model_config,
-            }
-            
-            # Let subclasses add framework-specific configuration to cache
-            framework_config = self._get_framework_config(db_agent)
-            if framework_config:
-                cache_config.update(framework_config)
-            
-            self.agents[agent_id]["config"] = cache_config
-            
-            # If agent was running, may need to restart
-            was_running = self.agents[agent_id]["status"] == "running"
-            if was_running:
-                self.stop_agent(agent_id)
-                self.start_agent(agent_id)
+            if owns_session:
+                db.commit()
+                self.refresh_agent_config(db_agent)
+                
+                # If agent was running, may need to restart
+                self.restart_if_running(agent_id)
+            else:
+                db.flush()
             
-            logger.info(f"Updated agent {agent_id}: {config.get('name')}")
+            logger.info("Updated agent %s: %s", agent_id, config.get('name'))
             return True
             
         except Exception as e:
-            logger.error(f"Error updating agent: {str(e)}")
+            logger.error("Error updating agent", exc_info=True)
             return False
         finally:
-            db.close()
+            if owns_session:
+                db.close()
+
+    def refresh_agent_config(self, db_agent: AgentModel) -> None:
+        """Copy an agent's committed configuration into the memory cache."""
+        cache_config = {
+            "name": db_agent.name,
+            "description": db_agent.description,
+            "framework": db_agent.framework,
+            "model": db_agent.model,
+            "model_config": db_agent.model_config,
+        }
+        
+        # Let subclasses add framework-specific configuration to cache
+        framework_config = self._get_framework_config(db_agent)
+        if framework_config:
+            cache_config.update(framework_config)
+        
+        self.agents[db_agent.id]["config"] = cache_config
+
+    def restart_if_running(self, agent_id: int) -> None:
+        """Restart a running agent so it picks up its updated configuration."""
+        if agent_id in self.agents and self.agents[agent_id]["status"] == "running":
+            self.stop_agent(agent_id)
+            self.start_agent(agent_id)
 
     def get_all_agents(self) -> Dict[int, Dict[str, Any]]:
         """Get information about all agents from database."""
@@ -395,24 +434,28 @@ class BaseAgentManager:
                 # Use the AgentModel to_dict method for the base data
                 result = agent.to_dict()
                 results[agent.id] = result
-                
+
                 # Ensure runtime cache is in sync
-                if agent.id not in self.agents:
-                    self.agents[agent.id] = {
-                        "config": result,
-                        "status": agent.status,
-                        "instance": None,
-                        "results": []
-                    }
-                
+                self.cache_agent(agent.id, result, agent.status)
+
             return results
         
         except Exception as e:
-            logger.error(f"Error getting all agents: {str(e)}")
+            logger.error("Error getting all agents", exc_info=True)
             return {}
         finally:
             db.close()
     
+    def cache_agent(self, agent_id: int, config: Dict[str, Any], status: str) -> None:
+        """Add an agent loaded from the database to the runtime cache if missing."""
+        if agent_id not in self.agents:
+            self.agents[agent_id] = {
+                "config": config,
+                "status": status,
+                "instance": None,
+                "results": []
+            }
+
     def update_agent_status(self, agent_id: int, status: str, error: str = None):
         """Update agent status in the database."""
         from backend.db.session import SessionLocal
@@ -425,9 +468,9 @@ class BaseAgentManager:
                 if error:
                     db_agent.error = error
                 db.commit()
-                logger.info(f"Updated agent {agent_id} status to {status}")
+                logger.info("Updated agent %s status to %s", agent_id, status)
         except Exception as e:
-            logger.error(f"Error updating agent status: {str(e)}")
+            logger.error("Error updating agent status", exc_info=True)
         finally:
             db.close()
     
@@ -32,7 +32,7 @@ class AgentManagerFactory:
         if not issubclass(manager_class, BaseAgentManager):
             raise ValueError(f"Manager class must inherit from BaseAgentManager")
         cls._registered_managers[framework_name] = manager_class
-        logger.info(f"Registered new agent manager: {framework_name}")
+        logger.info("Registered new agent manager: %s", framework_name)
         
     @classmethod
     def create_manager(cls, framework_name: str, **kwargs) -> Optional[BaseAgentManager]:
@@ -48,14 +48,14 @@ class AgentManagerFactory:
         """
         manager_class = cls._registered_managers.get(framework_name)
         if not manager_class:
-            logger.error(f"Unknown framework type: {framework_name}")
+            logger.error("Unknown framework type: %s", framework_name)
             return None
             
         try:
             manager = manager_class(**kwargs)
             return manager
         except Exception as e:
-            logger.error(f"Failed to create manager for {framework_name}: {str(e)}")
+            logger.error("Failed to create manager for %s: %s", framework_name, e)
             return None
     
     @classmethod
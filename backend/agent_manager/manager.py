@@ -20,6 +20,8 @@ class AgentProviderManager:
                           If None, all registered frameworks will be initialized.
         """
         self.providers = {}
+        # Bumped on every registration so callers can invalidate derived caches
+        self.revision = 0
         
         # Get list of frameworks to initialize
         if framework_list is None:
@@ -34,7 +36,8 @@ class AgentProviderManager:
     def register_provider(self, framework: str, provider: BaseAgentManager) -> None:
         """Register a provider with this manager."""
         self.providers[framework] = provider
-        logger.info(f"Registered {framework} agent provider")
+        self.revision += 1
+        logger.info("Registered %s agent provider", framework)
             
     def get_provider(self, framework: str) -> Optional[BaseAgentManager]:
         """Get a provider by framework name."""
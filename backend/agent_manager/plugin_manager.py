@@ -53,7 +53,7 @@ class PluginManager:
                         module = importlib.import_module(module_path)
                         self._register_managers_from_module(module)
                     except ImportError as e:
-                        logger.error(f"Error importing module {module_path}: {str(e)}")
+                        logger.error("Error importing module %s: %s", module_path, e)
     
     def _find_python_modules(self, package_dir: str) -> List[str]:
         """Find all Python modules in a directory."""
@@ -78,14 +78,14 @@ class PluginManager:
                     
                     # Register the manager
                     self._providers[framework_name] = instance
-                    logger.info(f"Automatically registered {framework_name} agent provider")
+                    logger.info("Automatically registered %s agent provider", framework_name)
                 except Exception as e:
-                    logger.error(f"Error registering {name} manager: {str(e)}")
+                    logger.error("Error registering %s manager: %s", name, e)
     
     def register_provider(self, framework_name: str, provider: BaseAgentManager) -> None:
         """Manually register a provider."""
         self._providers[framework_name] = provider
-        logger.info(f"Manually registered {framework_name} agent provider")
+        logger.info("Manually registered %s agent provider", framework_name)
 
 # Create singleton instance
 plugin_manager = PluginManager()
@@ -96,7 +96,7 @@ class AgnoManager(BaseAgentManager):
             # print(result.content)
             return result.content
         except Exception as e:
-            logger.error(f"Error executing query with Agno agent: {str(e)}")
+            logger.error("Error executing query with Agno agent: %s", e)
             return f"Error: {str(e)}"
     
     def start_agent(self, agent_id: int) -> bool:
@@ -106,7 +106,7 @@ class AgnoManager(BaseAgentManager):
             return False
             
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found")
+            logger.warning("Agent %s not found", agent_id)
             return False
             
         try:
@@ -120,12 +120,12 @@ class AgnoManager(BaseAgentManager):
             model_info = config.get("model", "openai:gpt-3.5-turbo").lower()
             model_type, model_id = model_info.split(":")
 
-            logger.info(f"Agno model ID: {model_id} and model type: {model_type}")
+            logger.info("Agno model ID: %s and model type: %s", model_id, model_type)
 
             if model_type == "openai":
                 model = OpenAIChat(id=model_id)
             else:
-                logger.error(f"Unknown model type: {model_type}")
+                logger.error("Unknown model type: %s", model_type)
                 return False
             
             # Create tool instances
@@ -147,11 +147,11 @@ class AgnoManager(BaseAgentManager):
             # Update database status
             super().update_agent_status(agent_id, "running")
             
-            logger.info(f"Started Agno agent {agent_id}")
+            logger.info("Started Agno agent %s", agent_id)
             return True
             
         except Exception as e:
-            logger.error(f"Error starting Agno agent {agent_id}: {str(e)}")
+            logger.error("Error starting Agno agent %s: %s", agent_id, e)
             self.agents[agent_id]["error"] = str(e)
             super().update_agent_status(agent_id, "error", str(e))
             return False
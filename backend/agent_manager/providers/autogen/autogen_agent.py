@@ -58,11 +58,11 @@ class AutoGenManager(BaseAgentManager):
         """Start an agent."""
         # Implement agent startup logic for your framework
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found in cache")
+            logger.warning("Agent %s not found in cache", agent_id)
             return False
             
         if self.agents[agent_id]["status"] == "running":
-            logger.info(f"Agent {agent_id} already running")
+            logger.info("Agent %s already running", agent_id)
             return True  # Already running
             
         
@@ -111,7 +111,7 @@ class AutoGenManager(BaseAgentManager):
                 db_agent.status = "running"
                 db_agent.error = None
                 db.commit()
-                logger.info(f"Agent {agent_id} started successfully")
+                logger.info("Agent %s started successfully", agent_id)
         finally:
             db.close()
             
@@ -1,6 +1,7 @@
 from crewai import Agent, Task, Crew
 import os
 import time
+from http import HTTPStatus
 from typing import Dict, Any, Union
 from sqlalchemy.orm import Session
 from backend.db.models import AgentModel, CrewAIAgentModel
@@ -108,11 +109,11 @@ class CrewAIManager(BaseAgentManager):
     def start_agent(self, agent_id: int) -> bool:
         """Start an agent by creating its CrewAI instance and update database."""        
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found in cache")
+            logger.warning("Agent %s not found in cache", agent_id)
             return False
             
         if self.agents[agent_id]["status"] == "running":
-            logger.info(f"Agent {agent_id} already running")
+            logger.info("Agent %s already running", agent_id)
             return True  # Already running
             
         try:
@@ -189,8 +190,13 @@ class CrewAIManager(BaseAgentManager):
         """Run a query against a CrewAI agent with retry logic."""
         # Add CrewAI specific validation
         if agent_id not in self.crews:
-            logger.warning(f"Agent {agent_id} crew not initialized")
-            return {"error": "Agent crew not initialized"}
+            logger.warning("Agent %s crew not initialized", agent_id)
+            # A stopped agent has no crew; like querying any agent that is not
+            # running, that is the client's mistake
+            return {
+                "error": "Agent crew not initialized",
+                "status_code": HTTPStatus.BAD_REQUEST
+            }
             
         # Use the base class implementation for the actual query execution
         return super().query_agent(agent_id, query, max_retries)
@@ -198,18 +204,18 @@ class CrewAIManager(BaseAgentManager):
     def _run_query(self, agent_id: int, query: str) -> str:
         """Execute the query using CrewAI (meant to run in a separate thread)."""
         start_time = time.time()
-        logger.info(f"Running query for agent {agent_id}: {query[:50]}...")
+        logger.info("Running query for agent %s: %s...", agent_id, query[:50])
         
         try:
             crew = self.crews.get(agent_id)
             if not crew:
-                logger.error(f"Agent {agent_id} crew not found")
+                logger.error("Agent %s crew not found", agent_id)
                 return "Error: Agent crew not initialized"
             
             # For a single agent, we need to create a task with the query
             agent = self.agents[agent_id]["instance"]
             if not agent:
-                logger.error(f"Agent {agent_id} instance not found")
+                logger.error("Agent %s instance not found", agent_id)
                 return "Error: Agent not initialized"
                 
             # Create a new task with the query
@@ -227,33 +233,38 @@ class CrewAIManager(BaseAgentManager):
             )
             
             # Execute the task
-            logger.info(f"Executing task for agent {agent_id}")
+            logger.info("Executing task for agent %s", agent_id)
             result = temp_crew.kickoff()
-            logger.info(f"Usage: {result.token_usage}")
+            logger.info("Usage: %s", result.token_usage)
 
             # Log completion
             duration = time.time() - start_time
-            logger.info(f"Query for agent {agent_id} completed in {duration:.2f} seconds")
+            logger.info("Query for agent %s completed in %.2f seconds", agent_id, duration)
             
             return str(result)
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"Error in _run_query for agent {agent_id} after {duration:.2f} seconds: {str(e)}")
+            logger.error("Error in _run_query for agent %s after %.2f seconds: %s", agent_id, duration, e)
             
             # Return a user-friendly error message
             return f"Sorry, I encountered an error while processing your request: {str(e)}"
             
+    def prepare_task_dict(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in the expected output when the request leaves it out."""
+        config.setdefault("expected_output", "Sort response")
+        return config
+
     def validate_agent_config(self, config: Dict[str, Any]) -> Union[bool, str]:
         """Validate CrewAI agent configuration."""
         required_fields = ["role", "task", "model","expected_output","backstory"]
         for field in required_fields:
             if field not in config:
-                logger.error(f"Validation failed: Missing field {field}")
+                logger.error("Validation failed: Missing field %s", field)
                 return f"Missing required field: {field}"
         for field in required_fields:
             if not config[field]:
-                logger.error(f"Validation failed: Empty field {field}")
+                logger.error("Validation failed: Empty field %s", field)
                 return f"Field '{field}' cannot be empty"
         # Additional validation can be added here
         logger.info("CrewAI agent configuration validated successfully")
@@ -51,13 +51,13 @@ class LangChainManager(BaseAgentManager):
         required_fields = ["agent_type", "model"]
         for field in required_fields:
             if field not in config:
-                logger.error(f"Missing required field: {field}")
+                logger.error("Missing required field: %s", field)
                 return f"Missing required field: {field}"
         
         # Validate agent_type is one of the allowed values
         valid_agent_types = ["conversational", "zero-shot-react-description", "react-docstore", "structured-chat"]
         if config["agent_type"] not in valid_agent_types:
-            logger.error(f"Invalid agent_type: {config['agent_type']}")
+            logger.error("Invalid agent_type: %s", config['agent_type'])
             return f"Invalid agent_type: {config['agent_type']}. Must be one of: {', '.join(valid_agent_types)}"
             
         # Validate tools is a list
@@ -138,11 +138,11 @@ class LangChainManager(BaseAgentManager):
     def start_agent(self, agent_id: int) -> bool:
         """Start a LangChain agent by creating its instance and update database."""        
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found in cache")
+            logger.warning("Agent %s not found in cache", agent_id)
             return False
             
         if self.agents[agent_id]["status"] == "running":
-            logger.info(f"Agent {agent_id} already running")
+            logger.info("Agent %s already running", agent_id)
             return True  # Already running
             
         try:
@@ -201,7 +201,7 @@ class LangChainManager(BaseAgentManager):
                     db_agent.status = "running"
                     db_agent.error = None
                     db.commit()
-                    logger.info(f"Agent {agent_id} started successfully")
+                    logger.info("Agent %s started successfully", agent_id)
             finally:
                 db.close()
                 
@@ -229,12 +229,12 @@ class LangChainManager(BaseAgentManager):
     def _run_query(self, agent_id: int, query: str) -> str:
         """Execute the query using LangChain (meant to run in a separate thread)."""
         start_time = time.time()
-        logger.info(f"Running query for agent {agent_id}: {query[:50]}...")
+        logger.info("Running query for agent %s: %s...", agent_id, query[:50])
         
         try:
             agent = self.agents[agent_id]["instance"]
             if not agent:
-                logger.error(f"Agent {agent_id} instance not found")
+                logger.error("Agent %s instance not found", agent_id)
                 return "Error: Agent not initialized"
             
             # Execute the query with the LangChain agent
@@ -242,13 +242,13 @@ class LangChainManager(BaseAgentManager):
             
             # Log completion
             duration = time.time() - start_time
-            logger.info(f"Query for agent {agent_id} completed in {duration:.2f} seconds")
+            logger.info("Query for agent %s completed in %.2f seconds", agent_id, duration)
             
             return str(result)
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"Error in _run_query for agent {agent_id} after {duration:.2f} seconds: {str(e)}")
+            logger.error("Error in _run_query for agent %s after %.2f seconds: %s", agent_id, duration, e)
             
             # Return a user-friendly error message
             return f"Sorry, I encountered an error while processing your request: {str(e)}"
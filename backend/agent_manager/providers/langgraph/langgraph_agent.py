@@ -39,7 +39,7 @@ class LanggraphManager(BaseAgentManager):
         required_fields = ["prompt", "tools"]
         for field in required_fields:
             if field not in config:
-                logger.error(f"Missing required field: {field}")
+                logger.error("Missing required field: %s", field)
                 return f"Missing required field: {field}"
         
         logger.info("Agent config validated successfully")
@@ -48,11 +48,11 @@ class LanggraphManager(BaseAgentManager):
     
     def start_agent(self, agent_id):
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found in cache")
+            logger.warning("Agent %s not found in cache", agent_id)
             return False
             
         if self.agents[agent_id]["status"] == "running":
-            logger.info(f"Agent {agent_id} already running")
+            logger.info("Agent %s already running", agent_id)
             return True  # Already running
             
         # try:
@@ -103,7 +103,7 @@ class LanggraphManager(BaseAgentManager):
                 db_agent.status = "running"
                 db_agent.error = None
                 db.commit()
-                logger.info(f"Agent {agent_id} started successfully")
+                logger.info("Agent %s started successfully", agent_id)
         finally:
             db.close()
             
@@ -112,19 +112,19 @@ class LanggraphManager(BaseAgentManager):
     def _run_query(self, agent_id: int, query: str):
         """Execute the query using LangChain (meant to run in a separate thread)."""
         start_time = time.time()
-        logger.info(f"Running query for agent {agent_id}: {query[:50]}...")
+        logger.info("Running query for agent %s: %s...", agent_id, query[:50])
         
         try:
             agent = self.agents[agent_id]["instance"]
             if not agent:
-                logger.error(f"Agent {agent_id} instance not found")
+                logger.error("Agent %s instance not found", agent_id)
                 return "Error: Agent not initialized"
             response = agent.invoke({"messages": [{"role": "user", "content": query}]})
             print(response.get('messages')[-1].content)
-            logger.info(f"Query completed in {time.time() - start_time:.2f} seconds")
+            logger.info("Query completed in %.2f seconds", time.time() - start_time)
             return response.get('messages')[-1].content
         except Exception as e:
-            logger.error(f"Error occurred while running query for agent {agent_id}: {e}")
+            logger.error("Error occurred while running query for agent %s: %s", agent_id, e)
             return "Error: Query execution failed"
 
     def _cleanup_agent_resources(self, agent_id):
@@ -188,12 +188,12 @@ class NewFrameworkManager(BaseAgentManager):
             result = agent_instance.run(query)
             
             # Log success
-            logger.info(f"Successfully executed query for agent {agent_id}")
+            logger.info("Successfully executed query for agent %s", agent_id)
             
             # Return the result
             return result
         except Exception as e:
-            logger.error(f"Error executing query with New Framework agent: {str(e)}")
+            logger.error("Error executing query with New Framework agent: %s", e)
             return f"Error: {str(e)}"
     
     def start_agent(self, agent_id: int) -> bool:
@@ -213,7 +213,7 @@ class NewFrameworkManager(BaseAgentManager):
             return False
             
         if agent_id not in self.agents:
-            logger.warning(f"Agent {agent_id} not found")
+            logger.warning("Agent %s not found", agent_id)
             return False
             
         try:
@@ -252,11 +252,11 @@ class NewFrameworkManager(BaseAgentManager):
             # Update database status
             super().update_agent_status(agent_id, "running")
             
-            logger.info(f"Started New Framework agent {agent_id}")
+            logger.info("Started New Framework agent %s", agent_id)
             return True
             
         except Exception as e:
-            logger.error(f"Error starting New Framework agent {agent_id}: {str(e)}")
+            logger.error("Error starting New Framework agent %s: %s", agent_id, e)
             self.agents[agent_id]["error"] = str(e)
             super().update_agent_status(agent_id, "error", str(e))
             return False
@@ -1,8 +1,7 @@
 from fastapi import FastAPI, Request, Response, Depends, HTTPException, status
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, create_model, validator
 from typing import Dict, Any, Optional, List, Union, Type, get_type_hints
 import os
 import logging
@@ -13,8 +12,14 @@ from sqlalchemy.orm import Session
 # Import local modules
 from backend.core.config import config
 from backend.db.session import init_db
-from backend.core.logging import get_logger
+from backend.core.logging import configure_logging, get_logger
 from backend.utils.security import verify_api_key
+
+# Configure logging before the routes import the agent managers, which log
+# as they load their agents
+configure_logging()
+
+from backend.api.routes.settings import load_persisted_settings
 from backend.api.routes import (
     agent_router,
     agent_execution_router,
@@ -38,9 +43,12 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing database...")
     init_db()
     
+    # Point the providers at the API keys saved through the settings page
+    load_persisted_settings()
+    
     # Log available agent providers
     from backend.agent_manager import managers
-    logger.info(f"Available agent providers: {', '.join(managers.keys())}")
+    logger.info("Available agent providers: %s", ', '.join(managers.keys()))
     
     # Yield to FastAPI
     yield
@@ -54,6 +62,8 @@ app = FastAPI(
     description="API for creating and managing AI agents",
     version="1.0.0",
     lifespan=lifespan,
+    # Encode route results with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs" if not config.server.is_production else None,
     redoc_url="/api/redoc" if not config.server.is_production else None,
 )
@@ -77,8 +87,8 @@ async def log_requests(request: Request, call_next):
     # Log request details
     duration = time.time() - start_time
     logger.debug(
-        f"{request.method} {request.url.path} "
-        f"completed in {duration:.4f}s with status {response.status_code}"
+        "%s %s completed in %.4fs with status %s",
+        request.method, request.url.path, duration, response.status_code
     )
     
     return response
@@ -93,3 +103,15 @@ app.mount("/static", StaticFiles(directory="frontend"), name="static")
 async def serve_frontend():
     """Serve the frontend application."""
     return FileResponse("frontend/index.html")
+
+def _check_unique_routes(app: FastAPI) -> None:
+    """Fail fast if two routes are registered for the same method and path."""
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
+
+_check_unique_routes(app)
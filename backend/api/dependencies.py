@@ -0,0 +1,90 @@
+"""
+Shared helpers for the API routes.
+"""
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.agent_manager import managers
+from backend.agent_manager.base import BaseAgentManager
+from backend.core.logging import get_logger
+from backend.db.models import AgentModel
+
+logger = get_logger(__name__)
+
+# Agent ID -> framework, filled on lookup and kept current by the agent routes
+_agent_frameworks: Dict[int, str] = {}
+
+# Agent ID -> (loaded at, ETag, body) for GET /agent/{id}, so bursts of
+# dashboard polls share one query. The routes drop an entry on every write;
+# the short TTL bounds staleness from other workers and background status
+# changes. Entries are kept in insertion order, so the oldest is evicted
+# first once the cache is full.
+_AGENT_CACHE_TTL = 2.0
+_AGENT_CACHE_MAXSIZE = 1024
+_agent_cache: Dict[int, Tuple[float, str, Dict[str, Any]]] = {}
+
+def agent_not_found(agent_id: int) -> HTTPException:
+    """Build the 404 raised wherever an agent ID does not exist."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Agent with ID %d not found" % agent_id
+    )
+
+def require_manager(framework: str) -> BaseAgentManager:
+    """Get the manager for a framework, raising a 404 if it is not supported."""
+    try:
+        return managers[framework]
+    except KeyError:
+        logger.warning("Framework %s not supported", framework)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
+        ) from None
+
+def require_agent_framework(db: Session, agent_id: int) -> str:
+    """Get an agent's framework, raising a 404 if the agent does not exist."""
+    framework = _agent_frameworks.get(agent_id)
+    if framework is None:
+        # Only the framework column is needed, not the whole agent row
+        framework = db.query(AgentModel.framework).filter(AgentModel.id == agent_id).scalar()
+        if framework is None:
+            raise agent_not_found(agent_id)
+        _agent_frameworks[agent_id] = framework
+    return framework
+
+def require_agent_manager(db: Session, agent_id: int) -> BaseAgentManager:
+    """Get the manager that owns an agent, raising a 404 if either is missing."""
+    return require_manager(require_agent_framework(db, agent_id))
+
+def cache_agent_framework(agent_id: int, framework: str) -> None:
+    """Record the framework of a newly created agent."""
+    _agent_frameworks[agent_id] = framework
+
+def forget_agent_framework(agent_id: int) -> None:
+    """Drop a deleted agent from the framework cache."""
+    _agent_frameworks.pop(agent_id, None)
+
+def get_cached_agent(agent_id: int) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Get a recently read agent's ETag and body, or None if missing or expired."""
+    entry = _agent_cache.get(agent_id)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > _AGENT_CACHE_TTL:
+        _agent_cache.pop(agent_id, None)
+        return None
+    return entry[1], entry[2]
+
+def remember_agent(agent_id: int, etag: str, body: Dict[str, Any]) -> None:
+    """Remember an agent read from the database."""
+    # Re-insert so a refreshed entry moves to the newest end
+    _agent_cache.pop(agent_id, None)
+    if len(_agent_cache) >= _AGENT_CACHE_MAXSIZE:
+        _agent_cache.pop(next(iter(_agent_cache)), None)
+    _agent_cache[agent_id] = (time.monotonic(), etag, body)
+
+def forget_cached_agent(agent_id: int) -> None:
+    """Drop an agent whose stored state was just changed."""
+    _agent_cache.pop(agent_id, None)
@@ -1,14 +1,38 @@
-from fastapi import  Request, Depends, HTTPException, status
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import  Request, Response, Body, Depends, HTTPException, Query, status
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 
-from backend.schemas.schemas import AgentCreateResponse
+from backend.schemas.schemas import (
+    AgentCreateRequest,
+    AgentCreateResponse,
+    AgentResponse,
+    AgentRestoreResponse,
+    AGENT_CREATE_RESPONSES_ADAPTER,
+    AGENT_UPDATE_REQUEST_ADAPTER
+)
 from backend.db.session import  get_db
 from backend.db.models import AgentModel, AgentVersionModel
 from backend.core.logging import get_logger
 from backend.utils.security import verify_api_key
 from backend.agent_manager import managers
+from backend.agent_manager.base import BaseAgentManager
+from backend.api.dependencies import (
+    agent_not_found,
+    require_manager,
+    require_agent_manager,
+    cache_agent_framework,
+    forget_agent_framework,
+    get_cached_agent,
+    remember_agent,
+    forget_cached_agent
+)
 
 
 # Set up logging
@@ -16,216 +40,301 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["agents"])
 
+# Agents are polled by the UI, so reads carry an ETag and clients revalidate
+_CACHE_CONTROL = "private, must-revalidate"
+
+def _etag_response(request: Request, etag: str, build_content) -> Response:
+    """Answer a conditional GET with 304 if the ETag matches, else build the JSON body."""
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return ORJSONResponse(content=build_content(), headers=headers)
+
+def _agent_response(agent: AgentModel) -> AgentResponse:
+    """Build the response model for a stored agent without re-validating it."""
+    return AgentResponse.model_construct(
+        id=agent.id,
+        name=agent.name,
+        description=agent.description,
+        framework=agent.framework,
+        model=agent.model,
+        model_settings=agent.model_config,
+        status=agent.status,
+        error=agent.error,
+        version=agent.version,
+        created_at=agent.created_at.isoformat() if agent.created_at else None,
+        updated_at=agent.updated_at.isoformat() if agent.updated_at else None
+    )
+
+def _serialize(body: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encode a response model directly, bypassing FastAPI's re-validation."""
+    return Response(
+        content=body.model_dump_json(by_alias=True),
+        media_type="application/json",
+        status_code=status_code
+    )
+
+# Most agents a single batch create request may contain
+_MAX_BATCH_SIZE = 100
+
+def _prepare_create(agent: AgentCreateRequest) -> Tuple[BaseAgentManager, Dict[str, Any]]:
+    """Get the manager for a new agent and its validated config, raising on bad input."""
+    # Get the appropriate manager for the framework
+    framework_manager = require_manager(agent.framework.lower())
+    
+    # Convert to dict to pass to manager, keeping framework-specific extras
+    task_dict = agent.model_dump(exclude_unset=True)
+    
+    # Rename the field for compatibility with the manager
+    if model_settings := task_dict.pop("model_settings", None):
+        task_dict["model_config"] = model_settings
+    
+    # Let the manager apply its framework-specific defaults
+    task_dict = framework_manager.prepare_task_dict(task_dict)
+    
+    # Every manager implements validate_agent_config (it is part of the
+    # base interface), so call it directly
+    validation_result = framework_manager.validate_agent_config(task_dict)
+    if validation_result is not True:
+        logger.warning("Agent validation failed: %s", validation_result)
+        raise HTTPException(status_code=400, detail=f"Invalid agent configuration: {validation_result}")
+    
+    return framework_manager, task_dict
+
+def _created_agent_response(agent_id: int, task_dict: Dict[str, Any]) -> AgentCreateResponse:
+    """Build the response for a new agent from the config it was created with."""
+    # The fields were validated on the way in, so the response is built
+    # without validating them again
+    return AgentCreateResponse.model_construct(
+        agent_id=agent_id,
+        agent=AgentResponse.model_construct(
+            id=agent_id,
+            name=task_dict["name"],
+            description=task_dict["description"],
+            framework=task_dict["framework"],
+            model=task_dict["model"],
+            model_settings=task_dict.get("model_config"),
+            status="stopped"
+        )
+    )
+
 @router.post("/agent", 
-         response_model=AgentCreateResponse,
+         responses={status.HTTP_201_CREATED: {"model": AgentCreateResponse}},
          dependencies=[Depends(verify_api_key)],
          summary="Create a new agent",
          description="Create a new agent with the specified configuration.",
          status_code=status.HTTP_201_CREATED)
-async def create_agent(request: Request):
+async def create_agent(agent: AgentCreateRequest, request: Request, db: Session = Depends(get_db)):
     """Create a new agent with the given configuration."""
-    # Parse request body
-    data = await request.json()
-    
-    # Validate framework first
-    if "framework" not in data:
-        raise HTTPException(status_code=400, detail="Framework must be specified")
-    
-    framework = data.get("framework").lower()
     client_ip = request.client.host if request.client else "unknown"
-    logger.info(f"Create agent request from {client_ip} for framework: {framework}")
+    logger.info("Create agent request from %s for framework: %s", client_ip, agent.framework.lower())
     
-    # Validate common fields first
-    required_fields = ["name", "description", "model"]
-    for field in required_fields:
-        if field not in data or not data[field]:
-            raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+    framework_manager, task_dict = _prepare_create(agent)
+    
+    def create() -> int:
+        # The manager only flushes into the request's session, so the agent
+        # commits with it
+        agent_id = framework_manager.create_agent(task_dict, db=db)
+        db.commit()
+        return agent_id
     
     try:
-
-        # Convert to dict to pass to manager
-        task_dict = data
-        
-        # Rename the field for compatibility with the manager
-        if task_dict.get("model_settings"):
-            task_dict["model_config"] = task_dict.pop("model_settings")
-        
-        # TODO
-        if framework=="crewai":
-            task_dict["expected_output"] = data.get("expected_output","Sort response")
-        
-        # Get the appropriate manager for the framework
-        if framework in managers:
-            framework_manager = managers[framework]
-        else:
-            logger.warning(f"Framework {framework} not supported, using default manager")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
-            )
-        
-        # Use the manager's validation method if available
-        if hasattr(framework_manager, 'validate_agent_config'):
-            validation_result = framework_manager.validate_agent_config(task_dict)
-            if validation_result is not True:
-                logger.warning(f"Agent validation failed: {validation_result}")
-                raise HTTPException(status_code=400, detail=f"Invalid agent configuration: {validation_result}")
-        
-        # Create agent using the selected manager
-        agent_id = framework_manager.create_agent(task_dict)
-        
-        logger.info(f"Created agent {agent_id} with name {task_dict['name']}")
-        
-        return {
-            "agent_id": agent_id, 
-            "agent": {
-                    "id": agent_id,
-                    "name": task_dict["name"],
-                    "description": task_dict["description"],
-                    "framework": task_dict["framework"],
-                    "status": "stopped",
-                    "model": task_dict["model"]
-                }
-            }
+        # Create agent using the selected manager in a worker thread to keep
+        # the event loop free
+        agent_id = await asyncio.to_thread(create)
     except Exception as e:
-        logger.error(f"Error creating agent: {str(e)}")
+        db.rollback()
+        logger.error("Error creating agent", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create agent: {str(e)}"
         )
+    
+    framework_manager.register_agent(agent_id, task_dict)
+    cache_agent_framework(agent_id, framework_manager.framework_name)
+    
+    logger.info("Created agent %s with name %s", agent_id, task_dict['name'])
+    
+    return _serialize(_created_agent_response(agent_id, task_dict), status_code=status.HTTP_201_CREATED)
+
+@router.post("/agents/batch",
+         responses={status.HTTP_201_CREATED: {"model": List[AgentCreateResponse]}},
+         dependencies=[Depends(verify_api_key)],
+         summary="Create several agents",
+         description="Create a list of agents in a single transaction; either all are created or none are.",
+         status_code=status.HTTP_201_CREATED)
+async def create_agents(
+    agents: List[AgentCreateRequest] = Body(..., min_length=1, max_length=_MAX_BATCH_SIZE),
+    db: Session = Depends(get_db)
+):
+    """Create several agents with one commit."""
+    logger.info("Batch create request for %d agents", len(agents))
+    
+    # Validate every agent before writing any of them
+    prepared = [_prepare_create(agent) for agent in agents]
+    
+    def create_all() -> List[int]:
+        # Each manager only flushes into the shared session, so the whole
+        # batch commits once
+        agent_ids = [manager.create_agent(task_dict, db=db) for manager, task_dict in prepared]
+        db.commit()
+        return agent_ids
+    
+    try:
+        agent_ids = await asyncio.to_thread(create_all)
+    except Exception as e:
+        db.rollback()
+        logger.error("Error creating agents", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create agents: {str(e)}"
+        )
+    
+    # Only committed agents are registered with their managers
+    for agent_id, (manager, task_dict) in zip(agent_ids, prepared):
+        manager.register_agent(agent_id, task_dict)
+        cache_agent_framework(agent_id, manager.framework_name)
+    
+    return Response(
+        content=AGENT_CREATE_RESPONSES_ADAPTER.dump_json(
+            [_created_agent_response(agent_id, task_dict) for agent_id, (_, task_dict) in zip(agent_ids, prepared)],
+            by_alias=True
+        ),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED
+    )
 
 @router.get("/agents", 
         dependencies=[Depends(verify_api_key)],
         summary="List all agents",
         description="Get a list of all created agents with their status.",
         status_code=status.HTTP_200_OK)
-async def list_agents():
+async def list_agents(request: Request, db: Session = Depends(get_db)):
     """List all agents in the system."""
-    # Combine agents from all managers
-    all_agents = {}
-    for framework, manager in managers.items():
-        framework_agents = manager.get_all_agents()
-        all_agents.update(framework_agents)
-    
-    return all_agents
+    # A single aggregate tells whether anything changed since the client's
+    # copy: any edit or status change moves updated_at, and deletes change
+    # the count
+    count, last_updated = db.query(
+        func.count(AgentModel.id), func.max(AgentModel.updated_at)
+    ).filter(AgentModel.framework.in_(list(managers.keys()))).one()
+    stamp = last_updated.timestamp() if last_updated else 0
+    etag = f'"{count}-{stamp}"'
+    
+    # Load agents for every registered framework in one query instead of
+    # one query per manager
+    return _etag_response(request, etag, lambda: list_all_agents(db))
+
+def list_all_agents(db: Session) -> dict:
+    """Get all agents of the registered frameworks keyed by agent ID."""
+    agents = db.query(AgentModel).filter(
+        AgentModel.framework.in_(list(managers.keys()))
+    ).options(
+        selectinload(AgentModel.crewai_config),
+        selectinload(AgentModel.langchain_config),
+        selectinload(AgentModel.agno_config),
+        selectinload(AgentModel.langgraph_config),
+    ).all()
+
+    results = {}
+    for agent in agents:
+        result = agent.to_dict()
+        results[agent.id] = result
+
+        # Keep the manager's runtime cache in sync, as get_all_agents does
+        managers[agent.framework].cache_agent(agent.id, result, agent.status)
+
+    return results
+
 @router.get("/agent/{agent_id}", 
         dependencies=[Depends(verify_api_key)],
         summary="Get agent details",
         description="Get detailed information about a specific agent.",
         status_code=status.HTTP_200_OK)
-async def get_agent(agent_id: int, db: Session = Depends(get_db)):
+async def get_agent(agent_id: int, request: Request, db: Session = Depends(get_db)):
     """Get detailed information about a specific agent."""
-    
-    
-    agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-    if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
-    return agent.to_dict()
+    cached = get_cached_agent(agent_id)
+    if cached is None:
+        agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
+        if not agent:
+            raise agent_not_found(agent_id)
+        
+        # The version changes on edits and updated_at on status changes as well
+        stamp = agent.updated_at.timestamp() if agent.updated_at else 0
+        etag = f'"{agent.id}-{agent.version}-{stamp}"'
+        cached = (etag, agent.to_dict())
+        remember_agent(agent_id, *cached)
+    
+    etag, body = cached
+    return _etag_response(request, etag, lambda: body)
 
 @router.put("/agent/{agent_id}",
         dependencies=[Depends(verify_api_key)],
+        responses={status.HTTP_200_OK: {"model": AgentCreateResponse}},
         summary="Update an agent",
         description="Update a specific agent's configuration.")
 async def update_agent(agent_id: int, request: Request, db: Session = Depends(get_db)):
     """Update an agent by ID."""
-    logger.info(f"Attempting to update agent {agent_id}")
+    logger.info("Attempting to update agent %s", agent_id)
     
-    # Parse request body
-    data = await request.json()
-    
-    # Get the agent to determine its framework
-    
-    agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-    if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
-    
-    # Get the framework, defaulting to the agent's current framework
-    framework = data.get("framework") or agent.framework
-    
-    # Apply framework-specific logic
+    # Parse and validate the raw request body in one pass with the prebuilt
+    # adapter; only the fields the client sent are handed to the manager
     try:
-        # Validate common fields
-        for field in ["name", "description"]:
-            if field in data and not data[field]:
-                raise HTTPException(status_code=400, detail=f"Field cannot be empty: {field}")
-        
-    except Exception as e:
-        if not isinstance(e, HTTPException):
-            raise HTTPException(status_code=400, detail=f"Invalid input for framework {framework}: {str(e)}")
-        else:
-            raise
-    
+        body = AGENT_UPDATE_REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        # Report errors against the body, as FastAPI does for declared bodies
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        ) from None
+    data = body.model_dump(exclude_unset=True)
+
     # Find the agent in the database to determine which framework to use
     agent_db = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
     if not agent_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
-    
+        raise agent_not_found(agent_id)
+
     # Get the appropriate manager
     framework = agent_db.framework
-    if framework in managers:
-        manager = managers[framework]
-    else:
-        logger.warning(f"Framework {framework} not supported, using default manager")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
-        )
-    
-    # Before updating, create a version of the current state
-    
-    current_version = agent_db.version
-    new_version = AgentVersionModel.from_dict(agent_db, current_version)
-    db.add(new_version)
+    manager = require_manager(framework)
     
     # Use the data dict to pass to manager
     task_dict = data
     
     # Rename the field back for compatibility with the manager
-    if task_dict.get("model_settings"):
-        task_dict["model_config"] = task_dict.pop("model_settings")
-    
-    # Use the manager's validation method if available
-    if hasattr(manager, 'validate_agent_config'):
-        # For update, we may need to get the current config and merge with changes
-        current_config = agent_db.to_dict()
-        # Merge current with updates, giving priority to updates
-        merged_config = {**current_config, **task_dict}
-        validation_result = manager.validate_agent_config(merged_config)
-        if validation_result is not True:
-            logger.warning(f"Agent validation failed: {validation_result}")
-            raise HTTPException(status_code=400, detail=f"Invalid agent configuration: {validation_result}")
-    
-    # Update the agent
-    success = manager.update_agent(agent_id, task_dict)
+    if model_settings := task_dict.pop("model_settings", None):
+        task_dict["model_config"] = model_settings
+    
+    # Validate the current config merged with the changes. to_dict() builds
+    # a fresh dict, so merge the updates into it in place, giving priority
+    # to updates
+    merged_config = agent_db.to_dict()
+    merged_config |= task_dict
+    validation_result = manager.validate_agent_config(merged_config)
+    if validation_result is not True:
+        logger.warning("Agent validation failed: %s", validation_result)
+        raise HTTPException(status_code=400, detail=f"Invalid agent configuration: {validation_result}")
+    
+    # Snapshot the current state and apply the update in one transaction, so a
+    # version is never recorded for an update that did not happen
+    current_version = agent_db.version
+    db.add(AgentVersionModel.from_dict(agent_db, current_version))
+    
+    success = manager.update_agent(agent_id, task_dict, db=db)
     
     if success:
         # Increment the version number
-        updated_agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-        updated_agent.version = current_version + 1
+        agent_db.version = current_version + 1
         db.commit()
+        manager.refresh_agent_config(agent_db)
+        forget_cached_agent(agent_id)
+        await asyncio.to_thread(manager.restart_if_running, agent_id)
         
-        return {
-            "agent_id": agent_id,
-            "agent": {
-                "id": agent_id,
-                "name": updated_agent.name,
-                "description": updated_agent.description,
-                "framework": updated_agent.framework,
-                "status": updated_agent.status,
-                "model": updated_agent.model,
-                "version": updated_agent.version
-            }
-        }
+        return _serialize(AgentCreateResponse.model_construct(
+            agent_id=agent_id,
+            agent=_agent_response(agent_db)
+        ))
     
+    db.rollback()
     raise HTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail="Failed to update agent"
@@ -238,30 +347,16 @@ async def update_agent(agent_id: int, request: Request, db: Session = Depends(ge
          description="Permanently delete an agent and all associated resources.")
 async def delete_agent(agent_id: int, db: Session = Depends(get_db)):
     """Delete an agent by ID."""
-    logger.info(f"Attempting to delete agent {agent_id}")
+    logger.info("Attempting to delete agent %s", agent_id)
     
-    # Find the agent in the database to determine which framework to use
-    agent_db = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-    if not agent_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
-    
-    # Get the appropriate manager
-    framework = agent_db.framework
-    if framework in managers:
-        manager = managers[framework]
-    else:
-        logger.warning(f"Framework {framework} not supported, using default manager")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
-        )
+    # Look up the agent's framework to determine which manager to use
+    manager = require_agent_manager(db, agent_id)
     
-    success = manager.delete_agent(agent_id)
+    success = await asyncio.to_thread(manager.delete_agent, agent_id)
     
     if success:
+        forget_agent_framework(agent_id)
+        forget_cached_agent(agent_id)
         return {"status": "deleted", "message": f"Agent {agent_id} deleted successfully"}
     
     raise HTTPException(
@@ -274,22 +369,25 @@ async def delete_agent(agent_id: int, db: Session = Depends(get_db)):
         dependencies=[Depends(verify_api_key)],
         summary="Get agent version history",
         description="Get the version history for a specific agent.")
-async def get_agent_versions(agent_id: int, db: Session = Depends(get_db)):
-    """Get version history for an agent."""
+async def get_agent_versions(
+    agent_id: int,
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of past versions to return"),
+    before: Optional[int] = Query(None, description="Only return versions older than this version number"),
+    db: Session = Depends(get_db)
+):
+    """Get version history for an agent, newest first, one page at a time."""
     
     
     # Check if agent exists
     agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
     if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
+        raise agent_not_found(agent_id)
     
-    # Get all versions for this agent
-    versions = db.query(AgentVersionModel).filter(
-        AgentVersionModel.agent_id == agent_id
-    ).order_by(AgentVersionModel.version_number.desc()).all()
+    # Get one page of versions, using the version number as the keyset cursor
+    query = db.query(AgentVersionModel).filter(AgentVersionModel.agent_id == agent_id)
+    if before is not None:
+        query = query.filter(AgentVersionModel.version_number < before)
+    versions = query.order_by(AgentVersionModel.version_number.desc()).limit(limit).all()
     
     # Include current version as well
     current_version = {
@@ -304,16 +402,23 @@ async def get_agent_versions(agent_id: int, db: Session = Depends(get_db)):
         "is_current": True
     }
     
-    # Format the response
-    version_history = [current_version] + [
-        {**v.to_dict(), "is_current": False} 
-        for v in versions
-    ]
+    # Format the response, with the current state heading the first page only
+    version_history = [current_version] if before is None else []
+    for v in versions:
+        # to_dict() already returns a fresh dict, so flag it in place
+        # rather than copying it
+        version_dict = v.to_dict()
+        version_dict["is_current"] = False
+        version_history.append(version_dict)
+    
+    # Cursor for the next page, or None when this page is the last one
+    next_before = versions[-1].version_number if len(versions) == limit else None
     
-    return {"versions": version_history}
+    return {"versions": version_history, "next_before": next_before}
 
 @router.post("/agent/{agent_id}/restore/{version_number}", 
         dependencies=[Depends(verify_api_key)],
+        responses={status.HTTP_200_OK: {"model": AgentRestoreResponse}},
         summary="Restore agent version",
         description="Restore an agent to a previous version.")
 async def restore_agent_version(agent_id: int, version_number: int, db: Session = Depends(get_db)):
@@ -322,10 +427,7 @@ async def restore_agent_version(agent_id: int, version_number: int, db: Session
     # Check if agent exists
     agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
     if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
+        raise agent_not_found(agent_id)
     
     # Get the specified version
     version = db.query(AgentVersionModel).filter(
@@ -339,41 +441,38 @@ async def restore_agent_version(agent_id: int, version_number: int, db: Session
             detail=f"Version {version_number} for agent {agent_id} not found"
         )
     
-    # Create a new version based on current state before restoring
-    current_version = AgentVersionModel.from_dict(agent, agent.version)
-    db.add(current_version)
-    
-    # Restore the agent to the specified version
-    agent.name = version.name
-    agent.description = version.description
-    agent.framework = version.framework
-    agent.role = version.role
-    agent.backstory = version.backstory
-    agent.task = version.task
-    agent.model = version.model
-    agent.model_config = version.model_config
-    agent.version = agent.version + 1  # Increment version number
-    
-    db.commit()
-    
     # Get the right manager for this framework
-    framework = agent.framework
-    if framework in managers:
-        manager = managers[framework]
-    else:
-        logger.warning(f"Framework {framework} not supported, using default manager")
+    manager = require_manager(agent.framework)
+    
+    # Create a new version based on current state before restoring
+    current_version = agent.version
+    db.add(AgentVersionModel.from_dict(agent, current_version))
+    
+    # Restore the agent to the specified version through the manager, which
+    # also updates the framework config, in the same transaction
+    restored_config = {
+        "name": version.name,
+        "description": version.description,
+        "model": version.model,
+        "model_config": version.model_config,
+        **(version.framework_config or {})
+    }
+    if not manager.update_agent(agent_id, restored_config, db=db):
+        db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to restore agent {agent_id} to version {version_number}"
         )
     
-    # Update the manager's cache
-    if agent.id in manager.agents:
-        manager.agents[agent.id]["config"] = agent.to_dict()
-    
-    return {
-        "agent_id": agent_id,
-        "message": f"Agent restored to version {version_number}",
-        "agent": agent.to_dict()
-    }
+    agent.version = current_version + 1  # Increment version number
+    db.commit()
+    manager.refresh_agent_config(agent)
+    forget_cached_agent(agent_id)
+    await asyncio.to_thread(manager.restart_if_running, agent_id)
+    
+    return _serialize(AgentRestoreResponse.model_construct(
+        agent_id=agent_id,
+        agent=_agent_response(agent),
+        message=f"Agent restored to version {version_number}"
+    ))
 
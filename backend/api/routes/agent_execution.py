@@ -1,10 +1,11 @@
+import asyncio
+
 from fastapi import APIRouter, Request, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from backend.db.session import get_db
-from backend.db.models import AgentModel
 from backend.core.logging import get_logger
 from backend.utils.security import verify_api_key
-from backend.agent_manager import managers
+from backend.api.dependencies import require_agent_manager, forget_cached_agent
 from backend.schemas.schemas import QueryRequest, QueryResponse
 
 
@@ -20,30 +21,16 @@ router = APIRouter(prefix="/api", tags=["agent execution"])
          description="Start a specific agent to prepare it for processing queries.")
 async def start_agent(agent_id: int, db: Session = Depends(get_db)):
     """Start an agent by ID."""
-    logger.info(f"Attempting to start agent {agent_id}")
+    logger.info("Attempting to start agent %s", agent_id)
     
-    # Find the agent in the database to determine which framework to use
-    agent_db = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-    if not agent_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
-    
-    # Get the appropriate manager
-    framework = agent_db.framework
-    if framework in managers:
-        manager = managers[framework]
-    else:
-        logger.warning(f"Framework {framework} not supported.")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
-        )
+    # Look up the agent's framework to determine which manager to use
+    manager = require_agent_manager(db, agent_id)
     
-    # Start the agent
-    success = manager.start_agent(agent_id)
-    logger.info(f"Agent {agent_id} start result: {success}")
+    # Starting builds the framework's LLM client and agent objects, so keep
+    # it off the event loop
+    success = await asyncio.to_thread(manager.start_agent, agent_id)
+    forget_cached_agent(agent_id)
+    logger.info("Agent %s start result: %s", agent_id, success)
     
     if success:
         return {"status": "started"}
@@ -59,26 +46,11 @@ async def start_agent(agent_id: int, db: Session = Depends(get_db)):
          description="Stop a running agent.")
 async def stop_agent(agent_id: int, db: Session = Depends(get_db)):
     """Stop an agent by ID."""
-    # Find the agent in the database to determine which framework to use
-    agent_db = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-    if not agent_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
-    
-    # Get the appropriate manager
-    framework = agent_db.framework
-    if framework in managers:
-        manager = managers[framework]
-    else:
-        logger.warning(f"Framework {framework} not supported, using default manager")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
-        )
+    # Look up the agent's framework to determine which manager to use
+    manager = require_agent_manager(db, agent_id)
 
-    success = manager.stop_agent(agent_id)
+    success = await asyncio.to_thread(manager.stop_agent, agent_id)
+    forget_cached_agent(agent_id)
     
     if success:
         return {"status": "stopped"}
@@ -97,51 +69,23 @@ async def stop_agent(agent_id: int, db: Session = Depends(get_db)):
 async def query_agent(agent_id: int, query_req: QueryRequest, request: Request, db: Session = Depends(get_db)):
     """Query a running agent."""
     client_ip = request.client.host if request.client else "unknown"
-    logger.info(f"Query for agent {agent_id} from {client_ip}: {query_req.query[:50]}...")
+    logger.info("Query for agent %s from %s: %s...", agent_id, client_ip, query_req.query[:50])
     
-    # Validate query length
-    if len(query_req.query) > 100:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Query too long. Maximum length is 100 characters."
-        )
+    # Look up the agent's framework to determine which manager to use
+    manager = require_agent_manager(db, agent_id)
     
-    # Find the agent in the database to determine which framework to use
-    agent_db = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
-    if not agent_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent with ID {agent_id} not found"
-        )
+    # The query blocks for the whole LLM round-trip, so run it in a worker
+    # thread to keep the event loop free for other requests
+    result = await asyncio.to_thread(manager.query_agent, agent_id, query_req.query)
+    # A failed query can mark the agent's status as errored
+    forget_cached_agent(agent_id)
     
-    # Get the appropriate manager
-    framework = agent_db.framework
-    if framework in managers:
-        manager = managers[framework]
-    else:
-        logger.warning(f"Framework {framework} not supported")
+    if "error" in result:
+        # Managers report the status for their errors; anything else is a
+        # server-side failure
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Framework {framework} not supported. Try creating agent using available frameworks."
+            status_code=result.get("status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
+            detail=result["error"]
         )
     
-    result = manager.query_agent(agent_id, query_req.query)
-    
-    if "error" in result:
-        if "not found" in result["error"].lower():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=result["error"]
-            )
-        elif "not running" in result["error"].lower():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=result["error"]
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result["error"]
-            )
-    
     return result
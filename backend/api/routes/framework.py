@@ -1,54 +1,78 @@
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
 from typing import List, Optional
 
 from backend.core.config import config
 from backend.utils.security import verify_api_key
-from backend.agent_manager import managers
+from backend.agent_manager import managers, agent_provider_manager
 from backend.schemas.schemas import FrameworkResponse, FrameworkSchema
 from backend.llm_manager.manager import llm_provider_manager
 # Create router
 router = APIRouter(prefix="/api", tags=["frameworks"])
 
+# Encoded /frameworks body and the provider registry revision it was built from
+_frameworks_body: Optional[bytes] = None
+_frameworks_revision = -1
+
+# Encoded /frameworks/schema body and the registry revision it was built from
+_schemas_body: Optional[str] = None
+_schemas_revision = -1
+
+# Common fields for all frameworks
+_COMMON_FIELDS = {
+    "name": "str",
+    "description": "str",
+    "framework": "str",
+    "model": "str",
+    "model_config": "dict"
+}
+
 @router.get("/frameworks/schema",
         summary="Get available frameworks and their schemas",
         response_model=FrameworkResponse,
         description="Returns the list of supported agent frameworks and their input schemas.")
 async def get_framework_schemas():
     """Get all available frameworks and their schemas."""
-    # Fetch framework schemas from agent managers
-    frameworks = {}
+    global _schemas_body, _schemas_revision
     
-    # Common fields for all frameworks
-    common_fields = {
-        "name": str,
-        "description": str,
-        "framework": str,
-        "model": str,
-        "model_config": dict
-    }
+    # Schemas only change when a provider registers, so build and encode the
+    # response once per registry revision
+    if _schemas_revision != agent_provider_manager.revision:
+        # Fetch framework schemas from agent managers
+        frameworks = {}
+        
+        # Get schema from each manager dynamically
+        for framework_name, manager in managers.items():
+            if hasattr(manager, 'get_schema'):
+                # Use the manager's get_schema method if available
+                schema = manager.get_schema()
+                frameworks[framework_name] = schema
+            else:
+                raise ValueError(f"Manager for {framework_name} does not implement get_schema()")
+        
+        _schemas_body = FrameworkResponse(
+            frameworks=frameworks,
+            common_fields=_COMMON_FIELDS
+        ).model_dump_json()
+        _schemas_revision = agent_provider_manager.revision
     
-    # Get schema from each manager dynamically
-    for framework_name, manager in managers.items():
-        if hasattr(manager, 'get_schema'):
-            # Use the manager's get_schema method if available
-            schema = manager.get_schema()
-            frameworks[framework_name] = schema
-        else:
-            raise ValueError(f"Manager for {framework_name} does not implement get_schema()")
-
-    return FrameworkResponse(
-        frameworks=frameworks,
-        common_fields=common_fields
-    )
+    return Response(content=_schemas_body, media_type="application/json")
 
 @router.get("/frameworks",
         summary="Get available frameworks",
         description="Returns the list of supported agent frameworks.")
 async def get_frameworks():
     """Get all available frameworks."""
-    return {
-        "frameworks": list(managers.keys())
-    }
+    global _frameworks_body, _frameworks_revision
+    
+    # Registration is static after startup, so only re-encode when it changes
+    if _frameworks_revision != agent_provider_manager.revision:
+        _frameworks_body = orjson.dumps({
+            "frameworks": list(managers.keys())
+        })
+        _frameworks_revision = agent_provider_manager.revision
+    
+    return Response(content=_frameworks_body, media_type="application/json")
 
 @router.get("/llm/providers",
         summary="List available LLM providers",
@@ -1,4 +1,7 @@
+import asyncio
 import os
+import time
+from typing import Dict, Optional
 from fastapi import APIRouter, HTTPException, Depends
 from backend.llm_manager.providers.config import llm_config
 from pydantic import BaseModel
@@ -9,6 +12,30 @@ from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/api", tags=["settings"])
 
+# In-process snapshot of the settings served by GET /settings. Other workers
+# can save settings too, so the snapshot is reloaded after the TTL expires.
+_SETTINGS_TTL = 60.0
+_settings_cache: Optional[Dict[str, str]] = None
+_settings_loaded_at = 0.0
+_settings_lock = asyncio.Lock()
+
+# Settings table row (provider, key) behind each API settings field
+_SETTING_KEYS = {
+    "openai_api_key": ("openai", "api_key"),
+    "azure_api_key": ("azure", "api_key"),
+    "azure_endpoint": ("azure", "endpoint"),
+    "groq_api_key": ("groq", "api_key"),
+}
+_SETTING_FIELDS = {row: field for field, row in _SETTING_KEYS.items()}
+
+# Environment variable the providers read for each API settings field
+_SETTING_ENV_VARS = {
+    "openai_api_key": "OPENAI_API_KEY",
+    "azure_api_key": "AZURE_OPENAI_API_KEY",
+    "azure_endpoint": "AZURE_OPENAI_ENDPOINT",
+    "groq_api_key": "GROQ_API_KEY",
+}
+
 class ApiSettings(BaseModel):
     """Settings model for API keys."""
     openai_api_key: str | None = None
@@ -16,9 +43,24 @@ class ApiSettings(BaseModel):
     azure_endpoint: str | None = None
     groq_api_key: str | None = None
 
-@router.get("/settings")
-async def get_settings(db: Session = Depends(get_db)):
-    """Get the current API key settings."""
+def _settings_expired() -> bool:
+    """Check whether the settings snapshot needs to be (re)loaded."""
+    return _settings_cache is None or time.monotonic() - _settings_loaded_at > _SETTINGS_TTL
+
+def _apply_settings(values: Dict[str, str]) -> None:
+    """Update the LLM config and environment variables the providers read."""
+    for field, value in values.items():
+        setattr(llm_config, field, value)
+        os.environ[_SETTING_ENV_VARS[field]] = value
+
+def _load_settings(db: Session) -> Dict[str, str]:
+    """
+    Load the API key settings from the config, overridden by database values.
+
+    Database values are applied to the providers as well, so the settings
+    served always match the ones in use, including values saved by another
+    worker.
+    """
     # Create a settings dictionary
     settings = {
         "openai_api_key": llm_config.openai_api_key,
@@ -31,41 +73,76 @@ async def get_settings(db: Session = Depends(get_db)):
     db_settings = db.query(SettingModel).filter(SettingModel.category == "llm_provider").all()
     
     # Update settings from database values if they exist
+    db_values = {}
     for setting in db_settings:
-        if setting.provider == "openai" and setting.key == "api_key":
-            settings["openai_api_key"] = setting.value
-        elif setting.provider == "azure" and setting.key == "api_key":
-            settings["azure_api_key"] = setting.value
-        elif setting.provider == "azure" and setting.key == "endpoint":
-            settings["azure_endpoint"] = setting.value
-        elif setting.provider == "groq" and setting.key == "api_key":
-            settings["groq_api_key"] = setting.value
+        field = _SETTING_FIELDS.get((setting.provider, setting.key))
+        if field:
+            db_values[field] = setting.value
     
+    _apply_settings(db_values)
+    settings.update(db_values)
     return settings
 
+def load_persisted_settings() -> None:
+    """Apply the settings saved in the database; called once at startup."""
+    global _settings_cache, _settings_loaded_at
+    
+    db = SessionLocal()
+    try:
+        _settings_cache = _load_settings(db)
+        _settings_loaded_at = time.monotonic()
+    finally:
+        db.close()
+
+def _persist_settings(db: Session, values: Dict[str, str]) -> None:
+    """Write the given settings to the database in a single transaction."""
+    # One query for the existing rows, then update them in place and insert
+    # the missing ones in the same flush
+    existing = {
+        (setting.provider, setting.key): setting
+        for setting in db.query(SettingModel).filter(SettingModel.category == "llm_provider").all()
+    }
+    
+    new_settings = []
+    for field, value in values.items():
+        provider, key = _SETTING_KEYS[field]
+        setting = existing.get((provider, key))
+        if setting:
+            setting.value = value
+        else:
+            new_settings.append(SettingModel(category="llm_provider", provider=provider, key=key, value=value))
+    
+    db.add_all(new_settings)
+    db.commit()
+
+@router.get("/settings")
+async def get_settings(db: Session = Depends(get_db)):
+    """Get the current API key settings."""
+    global _settings_cache, _settings_loaded_at
+    
+    if _settings_expired():
+        async with _settings_lock:
+            # Another request may have reloaded the snapshot while we waited
+            if _settings_expired():
+                _settings_cache = _load_settings(db)
+                _settings_loaded_at = time.monotonic()
+    
+    return dict(_settings_cache)
+
 @router.post("/settings")
-async def save_settings(settings: ApiSettings):
+async def save_settings(settings: ApiSettings, db: Session = Depends(get_db)):
     """Save API key settings and update environment variables."""
+    values = settings.model_dump(exclude_none=True)
+    
+    # Persist first so the saved values survive a restart
+    _persist_settings(db, values)
+    
     # Update config and environment variables
-    if settings.openai_api_key is not None:
-        llm_config.openai_api_key = settings.openai_api_key
-        os.environ["OPENAI_API_KEY"] = settings.openai_api_key
-        
-    if settings.azure_api_key is not None:
-        llm_config.azure_api_key = settings.azure_api_key
-        os.environ["AZURE_OPENAI_API_KEY"] = settings.azure_api_key
-        
-    if settings.azure_endpoint is not None:
-        llm_config.azure_endpoint = settings.azure_endpoint
-        os.environ["AZURE_OPENAI_ENDPOINT"] = settings.azure_endpoint
-        
-    if settings.groq_api_key is not None:
-        llm_config.groq_api_key = settings.groq_api_key
-        os.environ["GROQ_API_KEY"] = settings.groq_api_key
+    _apply_settings(values)
     
-    # Update environment variables
-    if settings.openai_api_key:
-        os.environ["OPENAI_API_KEY"] = settings.openai_api_key
+    # Keep the snapshot in step with the saved values
+    if _settings_cache is not None:
+        _settings_cache.update(values)
 
     
     return {"message": "Settings saved successfully"}
@@ -1,16 +1,23 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 from backend.core.config import config
 
 # Create router
 router = APIRouter(prefix="/api", tags=["system"])
 
+# None of the health fields change while the process runs, so the body is
+# encoded once at import instead of on every probe
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "version": "1.0.0",
+    "environment": config.server.environment
+})
+
 @router.get("/health", 
+        response_class=ORJSONResponse,
         summary="Health check",
         description="Check if the API is running and healthy.")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "ok",
-        "version": "1.0.0",
-        "environment": config.server.environment
-    }
+    return Response(content=_HEALTH_BODY, media_type=ORJSONResponse.media_type)
@@ -9,3 +9,5 @@ class DatabaseConfig(BaseModel):
     """Database configuration settings."""
     url: str = os.getenv("DATABASE_URL", "sqlite:///./Agenora.db")
     connect_args: dict = {"check_same_thread": False}  # For SQLite
+    pool_size: int = int(os.getenv("DB_POOL_SIZE", "25"))
+    max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "50"))
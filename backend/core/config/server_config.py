@@ -54,10 +54,15 @@ class ServerConfig(BaseModel):
             },
         }
         
-        # Add file handler only in production
+        # Add file handler only in production, writing JSON lines for log
+        # collectors
         if self.is_production:
+            config["formatters"]["json"] = {
+                "()": "backend.core.logging.OrjsonFormatter",
+                "datefmt": "%Y-%m-%d %H:%M:%S",
+            }
             config["handlers"]["file"] = {
-                "formatter": "default",
+                "formatter": "json",
                 "class": "logging.handlers.RotatingFileHandler",
                 "filename": "logs/agent_dashboard.log",
                 "maxBytes": 10485760,  # 10MB
@@ -1,38 +1,98 @@
 """
 Logging utilities for the agent dashboard.
 """
+import atexit
+import copy
 import logging
 import logging.config
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+import orjson
 from backend.core.config import config
 
-# Create logs directory if it doesn't exist
-logs_dir = Path(__file__).parent.parent.parent / "logs"
-logs_dir.mkdir(exist_ok=True)
-
 # Custom log format (FastAPI-style)
 LOG_FORMAT = "%(levelname)s:     %(name)s.py:%(lineno)d - %(message)s"
 # LOG_FORMAT = "%(levelname)s:     %(module)s.%(filename)s.py:%(lineno)d - %(message)s"
 
-# Configure logging based on environment
-if config.server.is_production:
+class OrjsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, encoded with orjson."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue records with their exception intact for the listener's formatters."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now, while they hold their values at the call
+        # site. The stock prepare also folds the traceback into the message
+        # and drops exc_info, which would hide it from OrjsonFormatter, so
+        # the traceback is left for each handler's formatter to render.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# Set once configure_logging has run in this process
+_configured = False
+
+def configure_logging() -> None:
+    """
+    Configure logging for the process based on the environment.
+
+    Safe to call more than once; only the first call has any effect, so
+    importing this module has no side effects.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    # Create logs directory if it doesn't exist
+    logs_dir = Path(__file__).parent.parent.parent / "logs"
     try:
-        logging.config.dictConfig(config.server.log_config)
-    except Exception as e:
-        # Fallback to basic configuration if dictConfig fails
-        logging.basicConfig(
-            level=getattr(logging, config.server.log_level.upper(), logging.INFO),
-            format=LOG_FORMAT,
-        )
-        logging.warning(
-            f"Failed to configure logging from dict config, using fallback: {e}"
-        )
-else:
-    # Simple configuration for development
-    logging.basicConfig(
-        level=getattr(logging, config.server.log_level.upper(), logging.DEBUG),
-        format=LOG_FORMAT,
-    )
+        logs_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # Read-only checkouts (e.g. in CI) can still log to the console
+        pass
+
+    # Resolve the configured level once for both branches
+    level = getattr(logging, str(config.server.log_level).upper(), None)
+
+    # Configure logging based on environment
+    if config.server.is_production:
+        try:
+            logging.config.dictConfig(config.server.log_config)
+        except Exception as e:
+            # Fallback to basic configuration if dictConfig fails
+            logging.basicConfig(level=level or logging.INFO, format=LOG_FORMAT)
+            logging.warning(
+                "Failed to configure logging from dict config, using fallback: %s", e
+            )
+    else:
+        # Simple configuration for development
+        logging.basicConfig(level=level or logging.DEBUG, format=LOG_FORMAT)
+
+    # Hand records to a background thread so request handlers never wait on
+    # console or file I/O; the configured handlers do the writing there
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        root.handlers = [_RecordQueueHandler(log_queue)]
+        listener.start()
+        atexit.register(listener.stop)
 
 # Default module logger
 logger = logging.getLogger(__name__)
@@ -13,6 +13,7 @@ from sqlalchemy import (
     JSON,
     DateTime,
     ForeignKey,
+    Index,
     Text
 )
 from sqlalchemy.orm import relationship
@@ -266,7 +267,8 @@ class LanggraphAgentModel(Base):
 class AgentVersionModel(Base):
     """Model to store agent versions for versioning history."""
     __tablename__ = "agent_versions"
-    # __table_args__ = {'extend_existing': True}
+    # Serves the version history pages, which seek on agent_id + version_number
+    __table_args__ = (Index("ix_agent_versions_agent_version", "agent_id", "version_number"),)
     
     id = Column(Integer, primary_key=True, index=True)
     agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False)
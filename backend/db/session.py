@@ -1,22 +1,75 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import Column, Integer, Table, create_engine, exc, insert, inspect, make_url, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from backend.core.config import config
 
-# Create SQLAlchemy engine and session
-engine = create_engine(config.database.url, connect_args=config.database.connect_args)
+# Size the pool for concurrent requests. In-memory SQLite gets a
+# single-connection pool that takes no sizing, so only pooled URLs get it.
+_url = make_url(config.database.url)
+_pool_args = {}
+if not (_url.get_backend_name() == "sqlite" and _url.database in (None, "", ":memory:")):
+    _pool_args = {
+        "pool_size": config.database.pool_size,
+        "max_overflow": config.database.max_overflow,
+    }
+
+# Create SQLAlchemy engine and session; only production pays for a liveness
+# check on every checkout
+engine = create_engine(
+    config.database.url,
+    connect_args=config.database.connect_args,
+    pool_pre_ping=config.server.is_production,
+    **_pool_args
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create base model
 Base = declarative_base()
 
+# Bump when the models gain tables or indexes so existing databases pick them
+# up. 2: ix_agent_versions_agent_version.
+SCHEMA_VERSION = 2
+
+# Single-row table recording the SCHEMA_VERSION the tables were created at
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, nullable=False)
+)
+
 # Database initialization and session management
 def init_db():
-    """Initialize the database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Initialize the database tables, unless they are already at SCHEMA_VERSION."""
+    # Register the model tables; run.py calls this before anything else has
+    # imported the models
+    import backend.db.models  # noqa: F401
+    
+    # One version read and one table listing on the usual launch instead of a
+    # DDL round-trip per table. The stamp alone is not trusted, so a database
+    # missing any model table is still initialized.
+    try:
+        with engine.connect() as conn:
+            if (
+                conn.execute(select(schema_version.c.version)).scalar() == SCHEMA_VERSION
+                and set(Base.metadata.tables) <= set(inspect(conn).get_table_names())
+            ):
+                return
+    except exc.DBAPIError:
+        # No schema_version table yet
+        pass
+    
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        # create_all skips tables that already exist along with their
+        # indexes, so add indexes introduced since those tables were created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        conn.execute(schema_version.delete())
+        conn.execute(insert(schema_version).values(version=SCHEMA_VERSION))
 
 # Create a dependency for database sessions
 def get_db():
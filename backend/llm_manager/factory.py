@@ -31,7 +31,7 @@ class LLMProviderFactory:
         if not issubclass(provider_class, BaseLLMProvider):
             raise ValueError(f"Provider class must inherit from BaseLLMProvider")
         cls._registered_providers[provider_name] = provider_class
-        logger.info(f"Registered new provider type: {provider_name}")
+        logger.info("Registered new provider type: %s", provider_name)
         
     @classmethod
     def create_provider(cls, provider_name: str, **kwargs) -> Optional[BaseLLMProvider]:
@@ -47,7 +47,7 @@ class LLMProviderFactory:
         """
         provider_class = cls._registered_providers.get(provider_name)
         if not provider_class:
-            logger.error(f"Unknown provider type: {provider_name}")
+            logger.error("Unknown provider type: %s", provider_name)
             return None
             
         try:
@@ -55,10 +55,10 @@ class LLMProviderFactory:
             if provider.validate_config():
                 return provider
             else:
-                logger.error(f"Provider {provider_name} failed validation")
+                logger.error("Provider %s failed validation", provider_name)
                 return None
         except Exception as e:
-            logger.error(f"Failed to create provider {provider_name}: {str(e)}")
+            logger.error("Failed to create provider %s: %s", provider_name, e)
             return None
     
     @classmethod
@@ -44,9 +44,9 @@ class LLMProviderManager:
         name = provider.provider_name
         if provider.validate_config():
             self.providers[name] = provider
-            logger.info(f"Registered {name} LLM provider with {len(provider.available_models)} models")
+            logger.info("Registered %s LLM provider with %s models", name, len(provider.available_models))
         else:
-            logger.warning(f"LLM provider {name} failed validation, not registering")
+            logger.warning("LLM provider %s failed validation, not registering", name)
             
     def get_provider(self, name: str) -> Optional[BaseLLMProvider]:
         """Get a provider by name."""
@@ -1,96 +1,145 @@
 """
 Pydantic schemas for the agent dashboard application.
 """
-from pydantic import BaseModel as PydanticBaseModel, Field as PydanticField, create_model
-from typing import List, Dict, Optional, Any, Union
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
-# Export renamed imports as original names to maintain compatibility
-BaseModel = PydanticBaseModel
-Field = PydanticField
+# OpenAPI examples, defined once at module level; treat as read-only
+_MODEL_SETTINGS_EXAMPLE = {
+    "temperature": 0.7,
+    "max_tokens": 2048
+}
+_QUERY_REQUEST_EXAMPLE = {
+    "query": "What are the latest trends in artificial intelligence?"
+}
 
 # Agent schemas
 class ModelSettings(BaseModel):
-    temperature: Optional[float] = 0.7
-    max_tokens: Optional[int] = 1000
-    top_p: Optional[float] = 1.0
-    frequency_penalty: Optional[float] = 0.0
-    presence_penalty: Optional[float] = 0.0
+    temperature: float | None = 0.7
+    max_tokens: int | None = 1000
+    top_p: float | None = 1.0
+    frequency_penalty: float | None = 0.0
+    presence_penalty: float | None = 0.0
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "temperature": 0.7,
-                "max_tokens": 2048
-            }
-        }
-    }
+    model_config = {"json_schema_extra": {"example": _MODEL_SETTINGS_EXAMPLE}}
 
 class BaseAgentTask(BaseModel):
     name: str 
     description: str 
     framework: str 
     model: str 
-    model_settings: Optional[ModelSettings] = None
-    human_input_mode: Optional[str] = "NEVER"
+    model_settings: ModelSettings | None = None
+    human_input_mode: str | None = "NEVER"
+    
+    model_config = {"protected_namespaces": ()}
+
+class AgentCreateRequest(BaseAgentTask):
+    """Create agent request body; framework-specific fields are passed through."""
+    name: str = Field(..., min_length=1)
+    description: str = Field(..., min_length=1)
+    model: str = Field(..., min_length=1)
+
+    model_config = {"extra": "allow", "protected_namespaces": ()}
+
+class AgentUpdateRequest(BaseModel):
+    """Update agent request body; omitted fields keep their current values."""
+    name: str = Field(None, min_length=1)
+    description: str = Field(None, min_length=1)
+
+    model_config = {"extra": "allow", "protected_namespaces": ()}
     
 class AgentResponse(BaseModel):
     id: int
     name: str
-    description: Optional[str] = None
+    description: str | None = None
     framework: str
     model: str
-    model_config: dict 
+    # Stored as AgentModel.model_config; renamed so it no longer collides with
+    # Pydantic's model_config class attribute, which silently replaced it. It
+    # is still sent and documented as model_config, as the GET and list
+    # responses send it.
+    model_settings: dict | None = Field(None, alias="model_config")
     status: str
-    error: Optional[str] = None
+    error: str | None = None
     version: int = 1
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: str | None = None
+    updated_at: str | None = None
     
     model_config = {
         "from_attributes": True,
-        "arbitrary_types_allowed": True
+        "populate_by_name": True,
+        "protected_namespaces": ()
     }
         
 class AgentCreateResponse(BaseModel):
     agent_id: int
     agent: AgentResponse
 
+class AgentRestoreResponse(AgentCreateResponse):
+    message: str
+
 # Agent execution schemas
 class QueryRequest(BaseModel):
-    query: str = Field(..., description="The query text to send to the agent")
-    conversation_id: Optional[str] = None
-    config: Optional[dict] = Field(default_factory=dict)
+    query: str = Field(..., max_length=100, description="The query text to send to the agent")
+    conversation_id: str | None = None
+    config: dict | None = None
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "query": "What are the latest trends in artificial intelligence?"
-            }
-        }
-    }
+    model_config = {"json_schema_extra": {"example": _QUERY_REQUEST_EXAMPLE}}
     
 class QueryResponse(BaseModel):
     response: str
-    conversation_id: Optional[str] = None
-    metadata: Optional[dict] = None
+    conversation_id: str | None = None
+    metadata: dict | None = None
 
 class StreamResponseItem(BaseModel):
     token: str
-    conversation_id: Optional[str] = None
-    finish_reason: Optional[str] = None
+    conversation_id: str | None = None
+    finish_reason: str | None = None
     is_finished: bool = False
+    
+    # Built once per streamed token from trusted internal data, so producers
+    # can use model_construct() and share instances without copying. No route
+    # streams yet, so the validator is only built on first use
+    model_config = {"frozen": True, "defer_build": True}
 
 # Settings schemas
+class ProviderConfig(BaseModel):
+    """Stored settings for one LLM provider, keyed as in the settings table."""
+    api_key: str | None = None
+    endpoint: str | None = None
+    
+    model_config = {"extra": "allow"}
+
 class Settings(BaseModel):
-    settings: Dict[str, Dict[str, Dict[str, str]]]
+    settings: dict[str, ProviderConfig]
+    
+    # Rarely validated, so skip building the validator at import
+    model_config = {"defer_build": True}
 
 
 class FrameworkSchema(BaseModel):
     name: str
     description: str
-    fields: Dict[str, str]
+    fields: dict[str, str]
+    
+    @field_validator("fields", mode="before")
+    @classmethod
+    def _type_names(cls, fields):
+        """Accept Python types for the field types, reporting them by name."""
+        if isinstance(fields, dict):
+            return {
+                name: field_type.__name__ if isinstance(field_type, type)
+                else str(field_type).replace("typing.", "")
+                for name, field_type in fields.items()
+            }
+        return fields
 
 class FrameworkResponse(BaseModel):
-    frameworks: Dict[str, FrameworkSchema]
-    common_fields: Dict[str, str]
+    frameworks: dict[str, FrameworkSchema]
+    common_fields: dict[str, str]
+
+# Validators built once at import, for bodies parsed outside FastAPI's
+# dependency injection
+AGENT_UPDATE_REQUEST_ADAPTER = TypeAdapter(AgentUpdateRequest)
 
+# Serializer for the batch create response, which is a list rather than a model
+AGENT_CREATE_RESPONSES_ADAPTER = TypeAdapter(list[AgentCreateResponse])
@@ -1,6 +1,7 @@
 """
 Security utilities for the agent dashboard.
 """
+import hmac
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader
 from backend.core.config import config
@@ -8,15 +9,23 @@ from backend.core.config import config
 # API key security
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-async def verify_api_key(api_key: str = Security(api_key_header)):
-    """Verify API key for protected endpoints."""
-    if not config.security.api_key_enabled:
-        return True
+# Security settings are fixed for the life of the process
+_API_KEY_ENABLED = config.security.api_key_enabled
+_API_KEY = (config.security.api_key or "").encode()
+
+if _API_KEY_ENABLED:
+    async def verify_api_key(api_key: str = Security(api_key_header)):
+        """Verify API key for protected endpoints."""
+        # Compare in constant time so response timing doesn't reveal the key
+        if not api_key or not hmac.compare_digest(api_key.encode(), _API_KEY):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Could not validate API key"
+            )
         
-    if api_key != config.security.api_key:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate API key"
-        )
-    
-    return True
+        return True
+else:
+    async def verify_api_key():
+        """Accept every request; API keys are disabled for this process."""
+        # No header dependency, so FastAPI has nothing to extract per request
+        return True
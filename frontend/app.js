@@ -663,6 +663,21 @@ async function updateModelsForProvider(provider) {
     }
 }
 
+// Turn an error response's detail into a message for the user. Request
+// validation errors arrive as a list, one entry per invalid field.
+function formatErrorDetail(detail) {
+    if (!Array.isArray(detail)) {
+        return detail;
+    }
+    return detail.map(error => {
+        const field = error.loc.filter(part => part !== 'body').join('.');
+        if (error.type === 'missing') {
+            return `Missing required field: ${field}`;
+        }
+        return field ? `${field}: ${error.msg}` : error.msg;
+    }).join('; ');
+}
+
 async function handleFormSubmit(event) {
     event.preventDefault();
     
@@ -731,7 +746,7 @@ async function handleFormSubmit(event) {
         
         if (!response.ok) {
             const errorData = await response.json();
-            throw new Error(errorData.detail || 'Something went wrong');
+            throw new Error(formatErrorDetail(errorData.detail) || 'Something went wrong');
         }
         
         // Close modal and refresh agents
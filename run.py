@@ -1,10 +1,13 @@
-import uvicorn
 import os
-import logging
-from backend.core.config import config
-from backend.db.session import init_db
+import sys
 
 if __name__ == "__main__":
+    # Import the backend only here: reload and worker processes are spawned,
+    # which re-imports this module, and they load the app on their own
+    import uvicorn
+    from backend.core.config import config
+    from backend.db.session import init_db
+    
     # Ensure logs directory exists
     os.makedirs("logs", exist_ok=True)
     
@@ -17,22 +20,33 @@ if __name__ == "__main__":
     # Run the application with hot reload in development
     is_dev = config.server.environment.lower() == "development"
     
-    # In development mode, use simpler logging config
+    # uvloop has no Windows build; fall back to uvicorn's default loop there
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    
+    # Settings shared by both environments
+    kwargs = dict(
+        app="backend.api.app:app",
+        host=config.server.host,
+        port=config.server.port,
+        loop=loop,
+        http="httptools",
+        log_level=config.server.log_level.lower()
+    )
+    
     if is_dev:
-        uvicorn.run(
-            "backend.api.app:app", 
-            host=config.server.host, 
-            port=config.server.port, 
-            reload=True,
-            log_level=config.server.log_level.lower()
-        )
+        # In development mode, reload on changes and use simpler logging config
+        # Only watch the backend package; the frontend, logs and database file
+        # never need a restart, and a short delay folds bursts of saves into one
+        kwargs.update(reload=True, reload_dirs=["backend"], reload_delay=0.25)
     else:
         # In production, use the full logging config
-        uvicorn.run(
-            "backend.api.app:app", 
-            host=config.server.host, 
-            port=config.server.port, 
-            reload=False,
-            log_level=config.server.log_level.lower(),
+        kwargs.update(
+            # Running agents and their status live in each process's memory, so
+            # run one worker unless WEB_CONCURRENCY explicitly asks for more
+            workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+            limit_concurrency=1000,
+            timeout_keep_alive=30,
             log_config=config.server.log_config
         )
+    
+    uvicorn.run(**kwargs)
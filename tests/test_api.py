@@ -1,10 +1,17 @@
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+import pytest_asyncio
+from fastapi.responses import ORJSONResponse
+from asgi_lifespan import LifespanManager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from backend.main import app
+from backend.api.app import app
+from backend.api import dependencies
 from backend.db.session import Base, get_db
 
 # Use in-memory SQLite for testing
@@ -14,72 +21,260 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create test database tables
-Base.metadata.create_all(bind=engine)
+# Skip the journal and sync bookkeeping on every commit; StaticPool opens the
+# one connection only once, so this runs once
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.close()
+connection = engine.connect()
+
+# Sessions join the connection's transaction: a route's commit releases a
+# SAVEPOINT instead of committing, so each test's writes can be rolled back
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=connection,
+    join_transaction_mode="create_savepoint",
+)
+
+# StaticPool pins the one connection, so every request shares one session
+# rather than allocating its own
+_session = TestingSessionLocal()
+
+# Create test database tables once, then run the whole session inside one
+# transaction on the single connection
+@pytest.fixture(scope="session", autouse=True)
+def _transaction():
+    Base.metadata.create_all(bind=connection)
+    connection.commit()
+    transaction = connection.begin()
+    yield
+    _session.close()
+    transaction.rollback()
+    connection.close()
+
+# Roll back whatever each test wrote, so tests pass in any order
+@pytest.fixture(autouse=True)
+def _savepoint():
+    savepoint = connection.begin_nested()
+    yield
+    _session.close()
+    savepoint.rollback()
+    # Rolled-back agent IDs are handed out again, so drop what the app
+    # remembered about them
+    dependencies._agent_cache.clear()
+    dependencies._agent_frameworks.clear()
 
 # Override database dependency
 def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+    yield _session
 
 app.dependency_overrides[get_db] = override_get_db
 
-# Create test client
-client = TestClient(app)
-
-def test_health_check():
-    """Test health check endpoint."""
-    response = client.get("/api/health")
-    assert response.status_code == 200
-    assert response.json()["status"] == "ok"
+# Create test client; ASGITransport calls the app in-process, without the
+# thread and event loop TestClient starts for every request. LifespanManager
+# runs the app's startup and shutdown the same way, without a server. Its
+# database work would hit the configured database, not the test one, so it is
+# patched out; the test schema is created by the _transaction fixture.
+@asynccontextmanager
+async def _client():
+    with patch("backend.api.app.init_db"), patch("backend.api.app.load_persisted_settings"):
+        async with LifespanManager(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                yield client
 
-def test_list_agents_empty():
-    """Test listing agents when there are none."""
-    response = client.get("/api/agents")
-    assert response.status_code == 200
-    assert response.json() == {}
+@pytest_asyncio.fixture
+async def client():
+    async with _client() as client:
+        yield client
 
-def test_create_agent():
-    """Test creating a new agent."""
+# Create an agent for the tests that need one; it is written inside the
+# test's savepoint like everything else
+@pytest_asyncio.fixture
+async def created_agent(client):
     agent_data = {
         "name": "Test Agent",
         "description": "A test agent",
+        "framework": "crewai",
         "role": "Tester",
+        "task": "Test the API",
+        "backstory": "Created for the API tests",
         "model": "gpt-3.5-turbo"
     }
     
-    response = client.post("/api/agent", json=agent_data)
+    return await client.post("/api/agent", json=agent_data)
+
+@pytest.mark.asyncio
+async def test_health_check(client):
+    """Test health check endpoint."""
+    response = await client.get("/api/health")
     assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+def test_default_response_class():
+    """Test that routes encode their results with orjson by default."""
+    assert app.router.default_response_class is ORJSONResponse
+
+@pytest.mark.asyncio
+async def test_list_agents_empty(client):
+    """Test listing agents when there are none."""
+    response = await client.get("/api/agents")
+    assert response.status_code == 200
+    assert response.json() == {}
+
+@pytest.mark.asyncio
+async def test_create_and_get_agent(client, created_agent):
+    """Test creating a new agent and then getting its details."""
+    assert created_agent.status_code == 201
     
-    data = response.json()
+    data = created_agent.json()
     assert "agent_id" in data
     assert data["agent"]["name"] == "Test Agent"
     assert data["agent"]["status"] == "stopped"
-
-def test_get_agent():
-    """Test getting details for a specific agent."""
-    # First create an agent
-    agent_data = {
-        "name": "Agent to Fetch",
-        "description": "An agent to test fetching",
-        "role": "Tester",
-        "model": "gpt-3.5-turbo"
-    }
-    
-    create_response = client.post("/api/agent", json=agent_data)
-    agent_id = create_response.json()["agent_id"]
+    # Same field name as the GET response below
+    assert "model_config" in data["agent"]
+    assert "model_settings" not in data["agent"]
     
-    # Now fetch the agent
-    response = client.get(f"/api/agent/{agent_id}")
+    # Fetch the agent that was just created rather than creating another
+    response = await client.get(f"/api/agent/{data['agent_id']}")
     assert response.status_code == 200
-    assert response.json()["name"] == "Agent to Fetch"
+    assert response.json()["name"] == "Test Agent"
+    assert "model_config" in response.json()
     
-def test_nonexistent_agent():
+@pytest.mark.asyncio
+async def test_nonexistent_agent(client):
     """Test getting a nonexistent agent."""
-    response = client.get("/api/agent/999")
+    response = await client.get("/api/agent/999")
     assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_batch_create(client):
+    """Test creating several agents in one request."""
+    agents_data = [
+        {
+            "name": f"Batch Agent {i}",
+            "description": "An agent created in a batch",
+            "framework": "crewai",
+            "role": "Tester",
+            "task": "Test batching",
+            "backstory": "Created for the batch test",
+            "model": "gpt-3.5-turbo"
+        }
+        for i in range(50)
+    ]
+    
+    response = await client.post("/api/agents/batch", json=agents_data)
+    assert response.status_code == 201
+    
+    created = response.json()
+    assert len(created) == 50
+    
+    # Every agent in the batch was committed and can be fetched
+    for i, item in enumerate(created):
+        response = await client.get(f"/api/agent/{item['agent_id']}")
+        assert response.status_code == 200
+        assert response.json()["name"] == f"Batch Agent {i}"
+
+@pytest.mark.asyncio
+async def test_get_agent_etag(client, created_agent):
+    """Test that an unchanged agent revalidates with 304 and an edited one does not."""
+    agent_id = created_agent.json()["agent_id"]
+    
+    response = await client.get(f"/api/agent/{agent_id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    
+    response = await client.get(f"/api/agent/{agent_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    
+    # An update moves the ETag, so the stale copy is replaced
+    response = await client.put(f"/api/agent/{agent_id}", json={"name": "Renamed Agent"})
+    assert response.status_code == 200
+    
+    response = await client.get(f"/api/agent/{agent_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["name"] == "Renamed Agent"
+
+@pytest.mark.asyncio
+async def test_list_agents_etag(client, created_agent):
+    """Test that an unchanged agent list revalidates with 304."""
+    response = await client.get("/api/agents")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    
+    response = await client.get("/api/agents", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+@pytest.mark.asyncio
+async def test_agent_versions_paging(client, created_agent):
+    """Test paging through an agent's version history with the before cursor."""
+    agent_id = created_agent.json()["agent_id"]
+    
+    # Two updates record versions 1 and 2 and leave the agent at version 3
+    for name in ("Second Name", "Third Name"):
+        response = await client.put(f"/api/agent/{agent_id}", json={"name": name})
+        assert response.status_code == 200
+    
+    # The first page is headed by the current state
+    response = await client.get(f"/api/agent/{agent_id}/versions", params={"limit": 1})
+    assert response.status_code == 200
+    page = response.json()
+    assert [v["version_number"] for v in page["versions"]] == [3, 2]
+    assert page["versions"][0]["is_current"] is True
+    assert page["next_before"] == 2
+    
+    response = await client.get(
+        f"/api/agent/{agent_id}/versions",
+        params={"limit": 1, "before": page["next_before"]}
+    )
+    page = response.json()
+    assert [v["version_number"] for v in page["versions"]] == [1]
+    assert page["versions"][0]["name"] == "Test Agent"
+    assert page["next_before"] == 1
+    
+    # Nothing is older than version 1, so this page is the last one
+    response = await client.get(
+        f"/api/agent/{agent_id}/versions",
+        params={"limit": 1, "before": page["next_before"]}
+    )
+    page = response.json()
+    assert page["versions"] == []
+    assert page["next_before"] is None
+
+@pytest.mark.asyncio
+async def test_restore_agent_version(client, created_agent):
+    """Test that restoring a version brings back its fields and framework config."""
+    agent_id = created_agent.json()["agent_id"]
+    
+    response = await client.put(
+        f"/api/agent/{agent_id}",
+        json={"name": "Renamed Agent", "role": "Reviewer"}
+    )
+    assert response.status_code == 200
+    assert response.json()["agent"]["version"] == 2
+    response = await client.get(f"/api/agent/{agent_id}")
+    assert response.json()["role"] == "Reviewer"
+    
+    response = await client.post(f"/api/agent/{agent_id}/restore/1")
+    assert response.status_code == 200
+    restored = response.json()["agent"]
+    assert restored["name"] == "Test Agent"
+    assert restored["version"] == 3
+    
+    # The framework config is restored too, not just the common fields
+    response = await client.get(f"/api/agent/{agent_id}")
+    assert response.status_code == 200
+    agent = response.json()
+    assert agent["name"] == "Test Agent"
+    assert agent["role"] == "Tester"
+    assert agent["version"] == 3